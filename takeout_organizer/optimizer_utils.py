@@ -1,10 +1,41 @@
 """Organize photos and videos from Google Takeout into a structured format."""
 
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 from PIL import Image
 
-from takeout_organizer.utils import get_image_paths
+from takeout_organizer.utils import copy_file, get_image_paths
+
+
+def _optimize_one(task: tuple[Path, Path, int, int, bool]) -> None:
+    """Resize a single image to fit within the given bounds and save it to the output path."""
+    image_path, output_path, max_width, max_height, delete_original_file = task
+
+    # mogrify -resize '2000x2000>' -path output_dir image_path
+    with Image.open(image_path) as img:
+        # Image.open only parses the header, so checking the size is cheap; images
+        # already within bounds are copied through without a decode/encode cycle.
+        if img.width <= max_width and img.height <= max_height:
+            copy_file(image_path, output_path)
+            if delete_original_file:
+                image_path.unlink(missing_ok=True)
+            return
+
+        if img.format == "JPEG":
+            # Let libjpeg scale down during decode; Lanczos still resizes to the exact target.
+            img.draft("RGB", (max_width * 2, max_height * 2))
+        img.thumbnail((max_width, max_height), Image.Resampling.LANCZOS)
+        if img.format == "JPEG":
+            # Reuse the source quantization tables and subsampling instead of
+            # re-encoding at quality=100, which produced files larger than the originals.
+            img.save(output_path, quality="keep", subsampling="keep", optimize=True, progressive=True)
+        else:
+            img.save(output_path, quality=90, optimize=True)
+
+    if delete_original_file:
+        image_path.unlink(missing_ok=True)
 
 
 def optimize_photos(
@@ -15,12 +46,10 @@ def optimize_photos(
     delete_original_files: bool,
 ) -> None:
     """Optimize photos and videos from the input directory to the output directory."""
-    for image_path in get_image_paths(input_dir):
-        # mogrify -resize '2000x2000>' -path output_dir image_path
-        with Image.open(image_path) as img:
-            img.thumbnail((max_width, max_height), Image.Resampling.LANCZOS)
-            output_path = output_dir / image_path.name
-            img.save(output_path, quality=100)
-
-        if delete_original_files:
-            image_path.unlink(missing_ok=True)
+    tasks = [
+        (image_path, output_dir / image_path.name, max_width, max_height, delete_original_files)
+        for image_path in get_image_paths(input_dir)
+    ]
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        for _ in executor.map(_optimize_one, tasks, chunksize=8):
+            pass
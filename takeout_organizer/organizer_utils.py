@@ -1,18 +1,26 @@
 """Organize photos and videos from Google Takeout into a structured format."""
 
-import json
 import os
 import shutil
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Optional, Union
 
+import orjson
 import piexif  # type: ignore[import-untyped]
 from PIL import Image
 from PIL.ExifTags import TAGS
 
-from takeout_organizer.utils import get_image_paths, get_video_paths
+from takeout_organizer.utils import copy_file, scan_media
+
+# Reverse map from tag name to tag id, built once so hot-path lookups are O(1).
+_TAG_IDS_BY_NAME = {name: tag_id for tag_id, name in TAGS.items()}
+
+# Translation table for turning EXIF dates into filename-safe prefixes in one pass.
+_PHOTO_FILENAME_DATE_TABLE = str.maketrans({":": "-", " ": "_"})
 
 
 def organize_photos_and_videos(
@@ -21,112 +29,203 @@ def organize_photos_and_videos(
     delete_original_files: bool,
 ) -> None:
     """Organize photos and videos from the input directory to the output directory."""
+    image_paths, video_paths, sidecar_paths = scan_media(input_dir)
+
     _organize_photos(
-        input_dir=input_dir,
+        image_paths=image_paths,
+        sidecar_paths=sidecar_paths,
         output_dir=output_dir,
         delete_original_files=delete_original_files,
     )
 
     _organize_videos(
-        input_dir=input_dir,
+        video_paths=video_paths,
+        sidecar_paths=sidecar_paths,
         output_dir=output_dir,
         delete_original_files=delete_original_files,
     )
 
 
 def _organize_photos(
-    input_dir: Path,
+    image_paths: list[Path],
+    sidecar_paths: set[Path],
     output_dir: Path,
     delete_original_files: bool,
 ) -> None:
     """Organize photos from the input directory to the output directory."""
-    for image_path in get_image_paths(input_dir):
-        json_data = None
-        json_path = _get_json_path(image_path)
-        if json_path and json_path.exists():
-            with open(json_path, "r", encoding="utf-8") as json_file:
-                json_data = json.load(json_file)
+    pending_deletes: list[Path] = []
+    for image_path in image_paths:
+        json_path = _get_json_path(image_path, sidecar_paths)
+        json_data = _load_json_sidecar(json_path) if json_path else None
+
+        # When the sidecar provides the date, the EXIF embed writes the image
+        # straight to its final output name, fusing embed and copy into one write.
+        written = False
         if json_data is not None:
-            _add_exif_to_image_file_from_json_data(image_path, json_data)
-
-        exif_date = _get_exif_date_from_image(image_path)
-        if exif_date == "":
-            exif_date = "1900:01:01 00:00:00"
-
-        # copy the image to the output directory
-        filename_date = exif_date.replace(":", "-").replace(" ", "_")
-        output_filename = filename_date + "-" + image_path.name
-        shutil.copy2(str(image_path), str(output_dir / output_filename))
+            exif_date = str(_get_exif_date_from_json_data(json_data))
+            if exif_date:
+                output_filename = exif_date.translate(_PHOTO_FILENAME_DATE_TABLE) + "-" + image_path.name
+                written = _add_exif_to_image_file_from_json_data(image_path, json_data, output_dir / output_filename)
+
+        if not written:
+            exif_date = _get_exif_date_from_image(image_path)
+            if exif_date == "":
+                exif_date = "1900:01:01 00:00:00"
+            output_filename = exif_date.translate(_PHOTO_FILENAME_DATE_TABLE) + "-" + image_path.name
+            copy_file(image_path, output_dir / output_filename)
 
         if delete_original_files:
-            image_path.unlink(missing_ok=True)
-            if json_path and json_path.exists():
-                json_path.unlink()
+            pending_deletes.append(image_path)
+            if json_path:
+                pending_deletes.append(json_path)
+
+    # Batch the deletes into one tight loop so the copy loop stays on its hot path.
+    for stale_path in pending_deletes:
+        try:
+            os.remove(stale_path)
+        except FileNotFoundError:
+            pass
 
 
 def _organize_videos(
-    input_dir: Path,
+    video_paths: list[Path],
+    sidecar_paths: set[Path],
     output_dir: Path,
     delete_original_files: bool,
 ) -> None:
     """Organize videos from the input directory to the output directory."""
-    for video_path in get_video_paths(input_dir):
-        json_data = None
-        json_path = _get_json_path(video_path)
-        if json_path and json_path.exists():
-            with open(json_path, "r", encoding="utf-8") as json_file:
-                json_data = json.load(json_file)
-        if json_data:
-            video_path_with_exif = _add_exif_to_video_file_from_json_data(video_path, json_data)
-        else:
-            video_path_with_exif = video_path
-
-        exif_date = _get_exif_date_from_video(video_path_with_exif)
-        if exif_date == "":
-            exif_date = "1900-01-01T00:00:00.000000Z"
-
-        # Copy the video to the output directory
-        filename_date = exif_date.replace(":", "-").replace("T", "_")[:19]
-        output_filename = filename_date + "-" + video_path_with_exif.name
-        output_path = output_dir / output_filename
-        shutil.copy2(str(video_path_with_exif), str(output_path))
-        if video_path != video_path_with_exif:
-            video_path_with_exif.unlink(missing_ok=True)
-
-        # Update timestamp from the filename
-        timestamp = datetime.strptime(exif_date[:19], "%Y-%m-%dT%H:%M:%S")
-        os.utime(output_path, (timestamp.timestamp(), timestamp.timestamp()))
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        futures = [
+            executor.submit(
+                _organize_one_video,
+                video_path,
+                _get_json_path(video_path, sidecar_paths),
+                output_dir,
+                delete_original_files,
+            )
+            for video_path in video_paths
+        ]
+        for future in futures:
+            future.result()
 
-        if delete_original_files:
-            if video_path.exists():
-                video_path.unlink()
-            if json_path and json_path.exists():
-                json_path.unlink()
+
+def _organize_one_video(
+    video_path: Path,
+    json_path: Optional[Path],
+    output_dir: Path,
+    delete_original_files: bool,
+) -> None:
+    """Organize a single video into the output directory."""
+    json_data = None
+    if json_path:
+        json_data = _load_json_sidecar(json_path)
+    if json_data:
+        video_path_with_exif = _add_exif_to_video_file_from_json_data(video_path, json_data)
+    else:
+        video_path_with_exif = video_path
+
+    video_date = _resolve_video_date(video_path_with_exif, json_data)
+
+    # Copy the video to the output directory; the date is parsed once and formats
+    # both the filename prefix and the file timestamp.
+    output_filename = video_date.strftime("%Y-%m-%d_%H-%M-%S") + "-" + video_path_with_exif.name
+    output_path = output_dir / output_filename
+    copy_file(video_path_with_exif, output_path)
+    if video_path != video_path_with_exif:
+        video_path_with_exif.unlink(missing_ok=True)
+
+    timestamp_ns = int(video_date.timestamp() * 1_000_000_000)
+    os.utime(output_path, ns=(timestamp_ns, timestamp_ns))
+
+    if delete_original_files:
+        for stale_path in (video_path, json_path):
+            if stale_path is not None:
+                try:
+                    os.remove(stale_path)
+                except FileNotFoundError:
+                    pass
+
+
+def _resolve_video_date(video_path: Path, json_data: Optional[dict[Any, Any]]) -> datetime:
+    """Resolve the video's date from the sidecar, ffprobe, or the 1900 fallback."""
+    if json_data:
+        # The creation_time just written came from the sidecar, so there is no
+        # need to probe it back out of the file.
+        json_date = _get_exif_date_from_json_data(json_data, get_dt_obj=True)
+        if isinstance(json_date, datetime):
+            return json_date
+
+    probed_date = _get_exif_date_from_video(video_path)
+    if probed_date:
+        try:
+            return datetime.fromisoformat(probed_date)
+        except ValueError:
+            print(f"Unparseable creation_time '{probed_date}' for {video_path}")
+    return datetime(1900, 1, 1, tzinfo=timezone.utc)
+
+
+@lru_cache(maxsize=None)
+def _load_json_sidecar(json_path: Path) -> dict[Any, Any]:
+    """Load the JSON sidecar file, caching the parsed result per path."""
+    with open(json_path, "rb") as json_file:
+        json_data: dict[Any, Any] = orjson.loads(json_file.read())
+    return json_data
 
 
-def _get_json_path(image_path: Path) -> Optional[Path]:
+def _get_json_path(image_path: Path, sidecar_paths: set[Path]) -> Optional[Path]:
     """Get the JSON path for the image's supplemental metadata file."""
     json_name = image_path.name + ".supplemental-metadata"
     json_path = image_path.with_name(json_name[:46] + ".json")
-    if json_path.exists():
+    if json_path in sidecar_paths:
         return json_path
     return None
 
 
+def _read_jpeg_exif_segment(image_path: Path) -> Optional[bytes]:
+    """Read the raw Exif APP1 segment from a JPEG file without decoding the image."""
+    with open(image_path, "rb") as jpeg_file:
+        if jpeg_file.read(2) != b"\xff\xd8":
+            return None
+        while True:
+            marker = jpeg_file.read(2)
+            if len(marker) != 2 or marker[0] != 0xFF:
+                return None
+            if marker[1] in (0xDA, 0xD9):  # start of scan / end of image: no APP1 ahead
+                return None
+            length = int.from_bytes(jpeg_file.read(2), "big")
+            if length < 2:
+                return None
+            if marker[1] == 0xE1:
+                segment = jpeg_file.read(length - 2)
+                if segment.startswith(b"Exif\x00\x00"):
+                    return segment
+            else:
+                jpeg_file.seek(length - 2, 1)
+
+
 def _get_exif_date_from_image(image_path: Path) -> str:
     """Get the EXIF date from the image file."""
+    if image_path.suffix.lower() in (".jpg", ".jpeg"):
+        # Only the APP1 header bytes are needed; skip the full Pillow open.
+        exif_segment = _read_jpeg_exif_segment(image_path)
+        if not exif_segment:
+            return ""
+        try:
+            exif_dict = piexif.load(exif_segment)
+        except Exception as e:  # pylint: disable=W0703
+            print(f"Error loading EXIF data for {image_path}: {e}")
+            return ""
+        date_time = exif_dict.get("0th", {}).get(piexif.ImageIFD.DateTime)
+        return date_time.decode("ascii", errors="replace") if date_time else ""
+
     image = Image.open(image_path)
     exif_data = image.getexif()
 
     if not exif_data:
         return ""
 
-    for tag_id, value in exif_data.items():
-        tag = TAGS.get(tag_id, tag_id)
-        if tag == "DateTime":
-            return str(value)
-
-    return ""
+    value = exif_data.get(_TAG_IDS_BY_NAME["DateTime"])
+    return str(value) if value is not None else ""
 
 
 def _get_exif_date_from_video(video_path: Path) -> str:
@@ -149,26 +248,8 @@ def _get_exif_date_from_video(video_path: Path) -> str:
     return result.stdout.decode().strip()
 
 
-def _add_exif_to_image_file_from_json_data(image_path: Path, json_data: dict[Any, Any]) -> None:
-    """Add EXIF data to the image file from the JSON data."""
-    exif_date = str(_get_exif_date_from_json_data(json_data))
-    if not exif_date:
-        print(f"EXIF date not found in JSON for {image_path}")
-        return
-
-    im = Image.open(image_path)
-
-    exif_data = im.info.get("exif", None)
-    exif_dict = {}
-    if exif_data:
-        try:
-            exif_dict = piexif.load(exif_data)
-        except Exception as e:  # pylint: disable=W0703
-            print(f"Error loading EXIF data for {image_path}: {e}")
-
-    if not exif_dict:
-        exif_dict = {"0th": {}, "Exif": {}, "GPS": {}, "Interop": {}, "1st": {}, "thumbnail": None}
-
+def _set_exif_fields_from_json_data(exif_dict: dict[Any, Any], json_data: dict[Any, Any], exif_date: str) -> None:
+    """Set the date, title, and GPS fields from the JSON data on the EXIF dict."""
     exif_dict["Exif"][piexif.ExifIFD.DateTimeOriginal] = exif_date.encode()
     exif_dict["Exif"][piexif.ExifIFD.DateTimeDigitized] = exif_date.encode()
     exif_dict["0th"][piexif.ImageIFD.DateTime] = exif_date.encode()
@@ -181,11 +262,13 @@ def _add_exif_to_image_file_from_json_data(image_path: Path, json_data: dict[Any
     lat, lon = gps.get("latitude"), gps.get("longitude")
     if lat and lon and (lat != 0.0 or lon != 0.0):
 
-        def to_deg(value: int) -> tuple[tuple[int, int], tuple[int, int], tuple[int, int]]:
-            """Convert decimal degrees to degrees, minutes, seconds."""
-            deg = int(value)
-            _min = int((value - deg) * 60)
-            sec = int((value - deg - _min / 60) * 3600 * 100)
+        def to_deg(value: float) -> tuple[tuple[int, int], tuple[int, int], tuple[int, int]]:
+            """Convert decimal degrees to degrees, minutes, and centi-arcseconds."""
+            # Round once to centi-arcseconds, then split with exact integer math;
+            # the old float version truncated each component and drifted by up to a second.
+            total_centisec = round(value * 360_000)
+            deg, remainder = divmod(total_centisec, 360_000)
+            _min, sec = divmod(remainder, 6_000)
             return ((deg, 1), (_min, 1), (sec, 100))
 
         gps_ifd = {
@@ -196,13 +279,82 @@ def _add_exif_to_image_file_from_json_data(image_path: Path, json_data: dict[Any
         }
         exif_dict["GPS"] = gps_ifd
 
+
+def _add_exif_to_image_file_from_json_data(image_path: Path, json_data: dict[Any, Any], output_path: Path) -> bool:
+    """Add EXIF data from the JSON data while writing the image to the output path."""
+    exif_date = str(_get_exif_date_from_json_data(json_data))
+    if not exif_date:
+        print(f"EXIF date not found in JSON for {image_path}")
+        return False
+
+    if image_path.suffix.lower() in (".jpg", ".jpeg"):
+        # piexif works on the JPEG byte stream directly, so the pixels are
+        # never decoded or re-encoded on this path.
+        exif_dict = {}
+        try:
+            exif_dict = piexif.load(str(image_path))
+        except Exception as e:  # pylint: disable=W0703
+            print(f"Error loading EXIF data for {image_path}: {e}")
+        exif_bytes = _dump_exif_bytes(image_path, exif_dict, json_data, exif_date)
+        if exif_bytes is None:
+            return False
+        try:
+            piexif.insert(exif_bytes, str(image_path), str(output_path))
+        except Exception as e:  # pylint: disable=W0703
+            print(f"Error inserting EXIF data for {image_path}: {e}")
+            return False
+        shutil.copystat(str(image_path), str(output_path))
+        return True
+
+    # One Image.open serves both the existing-EXIF read and the re-save.
+    with Image.open(image_path) as im:
+        exif_dict = {}
+        exif_data = im.info.get("exif", None)
+        if exif_data:
+            try:
+                exif_dict = piexif.load(exif_data)
+            except Exception as e:  # pylint: disable=W0703
+                print(f"Error loading EXIF data for {image_path}: {e}")
+        exif_bytes = _dump_exif_bytes(image_path, exif_dict, json_data, exif_date)
+        if exif_bytes is None:
+            return False
+        im.save(output_path, exif=exif_bytes)
+    shutil.copystat(str(image_path), str(output_path))
+    return True
+
+
+def _dump_exif_bytes(
+    image_path: Path,
+    exif_dict: dict[Any, Any],
+    json_data: dict[Any, Any],
+    exif_date: str,
+) -> Optional[bytes]:
+    """Fill the date, title, and GPS fields into the EXIF dict and dump it to bytes."""
+    if not exif_dict:
+        exif_dict = {"0th": {}, "Exif": {}, "GPS": {}, "Interop": {}, "1st": {}, "thumbnail": None}
+
+    _set_exif_fields_from_json_data(exif_dict, json_data, exif_date)
+
     try:
-        exif_bytes = piexif.dump(exif_dict)
+        exif_bytes: bytes = piexif.dump(exif_dict)
     except Exception as e:  # pylint: disable=W0703
         print(f"Error dumping EXIF data for {image_path}: {e}")
-        return
+        return None
+    return exif_bytes
 
-    im.save(image_path, exif=exif_bytes)
+
+def _video_creation_time_matches(video_path: Path, target_date: datetime) -> bool:
+    """Check whether the video's existing creation_time already matches the target date."""
+    existing = _get_exif_date_from_video(video_path)
+    if not existing:
+        return False
+    try:
+        existing_date = datetime.fromisoformat(existing)
+    except ValueError:
+        return False
+    if existing_date.tzinfo is None:
+        existing_date = existing_date.replace(tzinfo=timezone.utc)
+    return existing_date.timestamp() == target_date.timestamp()
 
 
 def _add_exif_to_video_file_from_json_data(video_path: Path, json_data: dict[Any, Any]) -> Path:
@@ -218,6 +370,11 @@ def _add_exif_to_video_file_from_json_data(video_path: Path, json_data: dict[Any
     temp_path = video_path.with_name(video_path.stem + "_temp.mp4")
 
     if video_path.suffix.lower() == ".mp4":
+        # If the container already carries the target creation_time (e.g. from a
+        # previous run), the whole re-mux pass can be skipped.
+        if _video_creation_time_matches(video_path, exif_date):
+            return video_path
+
         cmd = [
             "ffmpeg",
             "-i",
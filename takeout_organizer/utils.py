@@ -1,21 +1,99 @@
 """Common utils"""
 
+import os
+import shutil
 from pathlib import Path
+from typing import Iterator, Union
 
+try:
+    import fcntl
 
-def get_image_paths(directory: Path) -> list[Path]:
-    """Get all image paths from the given directory and its subdirectories."""
-    image_paths = []
-    for path in directory.rglob("*"):
-        if path.suffix.lower() in (".png", ".jpg", ".jpeg", ".bmp", ".tiff"):
-            image_paths.append(path)
-    return sorted(image_paths)
+    _HAS_FCNTL = True
+except ImportError:  # non-POSIX platforms have no ioctl; copy_file falls back to shutil
+    _HAS_FCNTL = False
 
+_IMAGE_SUFFIXES = frozenset((".png", ".jpg", ".jpeg", ".bmp", ".tiff"))
+_VIDEO_SUFFIXES = frozenset((".mp4", ".mov", ".avi", ".mkv", ".3gp"))
 
-def get_video_paths(directory: Path) -> list[Path]:
-    """Get all video paths from the given directory and its subdirectories."""
-    video_paths = []
-    for path in directory.rglob("*"):
-        if path.suffix.lower() in (".mp4", ".mov", ".avi", ".mkv", ".3gp"):
-            video_paths.append(path)
-    return sorted(video_paths)
+# Linux FICLONE ioctl: clone src's extents into dst (copy-on-write, no data copy).
+_FICLONE = 0x40049409
+
+# sendfile moves at most this many bytes per call; large enough that big videos
+# still need only a handful of syscalls.
+_SENDFILE_CHUNK = 1 << 30
+
+_HAS_SENDFILE = hasattr(os, "sendfile")
+
+
+def _sendfile_copy(src_fd: int, dst_fd: int) -> None:
+    """Stream src_fd into dst_fd with in-kernel sendfile, never touching userspace buffers."""
+    offset = 0
+    while True:
+        sent = os.sendfile(dst_fd, src_fd, offset, _SENDFILE_CHUNK)
+        if sent == 0:
+            return
+        offset += sent
+
+
+def copy_file(src: Union[str, Path], dst: Union[str, Path]) -> None:
+    """Copy src to dst with metadata, cloning the data copy-on-write when the filesystem supports it."""
+    if not _HAS_FCNTL or not _HAS_SENDFILE:
+        # Neither reflink nor in-kernel streaming is available (e.g. Windows).
+        shutil.copy2(src, dst)
+        return
+    try:
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            try:
+                fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+            except OSError:
+                # Filesystem without reflink support (or cross-device copy);
+                # stream the bytes kernel-side instead.
+                _sendfile_copy(fsrc.fileno(), fdst.fileno())
+    except OSError:
+        shutil.copy2(src, dst)
+        return
+    shutil.copystat(src, dst)
+
+
+def _scan_files_with_suffixes(directory: Path, suffixes: frozenset[str]) -> Iterator[Path]:
+    """Walk the directory tree with os.scandir, yielding files with the given suffixes."""
+    pending = [str(directory)]
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                elif os.path.splitext(entry.name)[1].lower() in suffixes:
+                    yield Path(entry.path)
+
+
+def scan_media(directory: Path) -> tuple[list[Path], list[Path], set[Path]]:
+    """Walk the directory tree once, separating image, video, and JSON sidecar paths."""
+    images: list[Path] = []
+    videos: list[Path] = []
+    sidecars: set[Path] = set()
+    pending = [str(directory)]
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                    continue
+                suffix = os.path.splitext(entry.name)[1].lower()
+                if suffix in _IMAGE_SUFFIXES:
+                    images.append(Path(entry.path))
+                elif suffix in _VIDEO_SUFFIXES:
+                    videos.append(Path(entry.path))
+                elif suffix == ".json":
+                    sidecars.add(Path(entry.path))
+    return images, videos, sidecars
+
+
+def get_image_paths(directory: Path) -> Iterator[Path]:
+    """Yield all image paths from the given directory and its subdirectories."""
+    return _scan_files_with_suffixes(directory, _IMAGE_SUFFIXES)
+
+
+def get_video_paths(directory: Path) -> Iterator[Path]:
+    """Yield all video paths from the given directory and its subdirectories."""
+    return _scan_files_with_suffixes(directory, _VIDEO_SUFFIXES)